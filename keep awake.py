@@ -6,6 +6,10 @@ import sys
 import os
 import winreg
 import threading
+import signal
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from ctypes import wintypes
 
@@ -32,7 +36,8 @@ state = {
     'startup_enabled': False,  # Default is off
     'shutdown_timer': None,
     'shutdown_time': None,
-    'shutdown_thread': None
+    'shutdown_thread': None,
+    'daemon_stop': None
 }
 
 # UI indicators with emoji fallback
@@ -418,6 +423,101 @@ def keep_awake_for_duration(minutes=60):
     finally:
         restore_normal_power()
 
+def request_daemon_stop():
+    """Ask the running daemon loop to shut down"""
+    if state['daemon_stop'] is not None:
+        state['daemon_stop'].set()
+
+def install_daemon_signal_handlers(loop):
+    """Route SIGINT/SIGTERM (and SIGBREAK on Windows) into the daemon loop"""
+    signals = [signal.SIGINT, signal.SIGTERM]
+    if hasattr(signal, 'SIGBREAK'):
+        signals.append(signal.SIGBREAK)
+    
+    # Maps each signal to the handler it replaced, or None if the loop owns it
+    installed = {}
+    for sig in signals:
+        try:
+            loop.add_signal_handler(sig, request_daemon_stop)
+            installed[sig] = None
+        except (NotImplementedError, RuntimeError):
+            # Windows event loops don't support add_signal_handler
+            installed[sig] = signal.getsignal(sig)
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(request_daemon_stop))
+    return installed
+
+def remove_daemon_signal_handlers(loop, installed):
+    """Undo install_daemon_signal_handlers, restoring the previous handlers"""
+    for sig, previous in installed.items():
+        if previous is None:
+            loop.remove_signal_handler(sig)
+        else:
+            signal.signal(sig, previous)
+
+async def daemon_timer(duration_seconds):
+    """Coroutine for the daemon shutdown timer"""
+    # One sleep until the deadline - no polling between events
+    await asyncio.sleep(duration_seconds)
+    icons = get_indicators()
+    safe_print(f"{icons['sleep']} Timer expired - quitting this software now")
+    request_daemon_stop()
+
+async def run_daemon(power_executor, duration_seconds=None):
+    """Daemon main coroutine: keep awake until stopped by signal or timer"""
+    loop = asyncio.get_running_loop()
+    icons = get_indicators()
+    state['daemon_stop'] = asyncio.Event()
+    installed_signals = install_daemon_signal_handlers(loop)
+    timer_task = None
+    
+    try:
+        # Power backend always runs on the same executor thread, because
+        # SetThreadExecutionState is tied to the calling thread on Windows
+        await loop.run_in_executor(power_executor, keep_system_awake)
+        
+        if duration_seconds is not None:
+            state['shutdown_time'] = datetime.now() + timedelta(seconds=duration_seconds)
+            timer_task = loop.create_task(daemon_timer(duration_seconds))
+        
+        display_status = icons['display_on'] if state['display_on'] else icons['display_off']
+        safe_print(f"{icons['app']} Started in daemon mode. Send SIGTERM or press Ctrl+C to quit.")
+        safe_print(f"{icons['status']} Display: {display_status}")
+        safe_print(f"{icons['status']} Timer: {get_timer_status()}")
+        
+        await state['daemon_stop'].wait()
+    finally:
+        if timer_task is not None:
+            timer_task.cancel()
+        state['shutdown_time'] = None
+        state['daemon_stop'] = None
+        remove_daemon_signal_handlers(loop, installed_signals)
+
+def run_daemon_mode(duration_seconds=None):
+    """Run headless daemon mode on a single asyncio event loop"""
+    icons = get_indicators()
+    power_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keep-awake-power")
+    
+    try:
+        asyncio.run(run_daemon(power_executor, duration_seconds))
+    except KeyboardInterrupt:
+        safe_print(f"\n{icons['sleep']} Stopping...")
+    finally:
+        # Restore outside the loop so it happens even if the loop was torn down
+        restore_future = power_executor.submit(restore_normal_power)
+        try:
+            while True:
+                try:
+                    restore_future.result()
+                    break
+                except KeyboardInterrupt:
+                    # Keep waiting - the restore is already running
+                    safe_print("Still restoring normal power...")
+        except Exception as e:
+            safe_print(f"Error restoring normal power: {e}")
+        finally:
+            power_executor.shutdown(wait=True)
+        safe_print("Done!")
+
 def get_startup_registry_key():
     """Get the Windows startup registry key"""
     return winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run"
@@ -649,9 +749,36 @@ def create_timer_menu_item(duration_name, duration_seconds):
     
     return item(duration_name, set_timer)
 
+def parse_args(argv):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Keep the system awake")
+    parser.add_argument('--daemon', action='store_true',
+                        help="run headless without tray or console commands")
+    parser.add_argument('--display', action='store_true',
+                        help="also keep the display on")
+    parser.add_argument('--timer', type=int, metavar='SECONDS',
+                        help="quit automatically after SECONDS (requires --daemon)")
+    args = parser.parse_args(argv)
+    if args.timer is not None:
+        if not args.daemon:
+            parser.error("--timer requires --daemon")
+        if args.timer <= 0:
+            parser.error("--timer must be a positive number of seconds")
+        max_timer = max(seconds for seconds in get_timer_options().values() if seconds)
+        if args.timer > max_timer:
+            parser.error(f"--timer must be at most {max_timer} seconds")
+    return args
+
 def main():
     """Main function to run the Keep Awake application"""
-    run_tray_app()
+    args = parse_args(sys.argv[1:])
+    if args.display:
+        state['display_on'] = True
+    
+    if args.daemon:
+        run_daemon_mode(args.timer)
+    else:
+        run_tray_app()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file